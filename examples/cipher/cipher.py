@@ -26,14 +26,13 @@ cipher caesar-encode 1 'Hello world!'  # Ifmmp xpsme!
 cipher caesar-decode 1 'Ifmmp xpsme!'  # Hello world!
 """
 
-import fire
+# Module globals become CLI commands, so the alphabets are private constants.
+_UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWERCASE = _UPPERCASE.lower()
 
 
 def caesar_encode(n=0, text=''):
-  return ''.join(
-      _caesar_shift_char(n, char)
-      for char in text
-  )
+  return text.translate(_table(n))
 
 
 def caesar_decode(n=0, text=''):
@@ -41,18 +40,28 @@ def caesar_decode(n=0, text=''):
 
 
 def rot13(text):
-  return caesar_encode(13, text)
+  return text.translate(_table(13))
 
 
-def _caesar_shift_char(n=0, char=' '):
-  if not char.isalpha():
-    return char
-  if char.isupper():
-    return chr((ord(char) - ord('A') + n) % 26 + ord('A'))
-  return chr((ord(char) - ord('a') + n) % 26 + ord('a'))
+def _table(n):
+  """Returns a str.translate table that shifts ASCII letters by n."""
+  return _SHIFT_TABLES[n % 26]
+
+
+def _shift_table(n):
+  """Builds the str.translate table that shifts ASCII letters by 0 <= n < 26."""
+  upper = _UPPERCASE
+  lower = _LOWERCASE
+  return str.maketrans(
+      upper + lower, upper[n:] + upper[:n] + lower[n:] + lower[:n])
+
+
+# The tables for every shift, built once at import.
+_SHIFT_TABLES = tuple(_shift_table(n) for n in range(26))
 
 
 def main():
+  import fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
   fire.Fire(name='cipher')
 
 if __name__ == '__main__':
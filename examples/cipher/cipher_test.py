@@ -29,6 +29,10 @@ class CipherTest(testutils.BaseTestCase):
     self.assertEqual(cipher.caesar_encode(1, 'Hello world!'), 'Ifmmp xpsme!')
     self.assertEqual(cipher.caesar_decode(1, 'Ifmmp xpsme!'), 'Hello world!')
 
+  def testCipherWrapsAround(self):
+    self.assertEqual(cipher.caesar_encode(27, 'Zebra 42'), 'Afcsb 42')
+    self.assertEqual(cipher.caesar_decode(27, 'Afcsb 42'), 'Zebra 42')
+
 
 if __name__ == '__main__':
   testutils.main()
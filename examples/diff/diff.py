@@ -33,6 +33,9 @@ diff FROMFILE TOFILE context-diff [LINES]
 diff FROMFILE TOFILE unified-diff [LINES]
 diff FROMFILE TOFILE ndiff
 diff FROMFILE TOFILE make-file [CONTEXT] [LINES]
+diff FROMFILE TOFILE context-diff-str [LINES]
+diff FROMFILE TOFILE unified-diff-str [LINES]
+diff FROMFILE TOFILE ndiff-str
 
 Using the Flag syntax, the usage is:
 
@@ -55,10 +58,12 @@ The Flags available for all Fire CLIs are:
 """
 
 import difflib
+import io
 import os
+import re
 import time
 
-import fire
+_HTML_DIFF = difflib.HtmlDiff()
 
 
 class DiffLibWrapper(object):
@@ -72,12 +77,38 @@ class DiffLibWrapper(object):
     self._fromfile = fromfile
     self._tofile = tofile
 
-    self.fromdate = time.ctime(os.stat(fromfile).st_mtime)
-    self.todate = time.ctime(os.stat(tofile).st_mtime)
-    with open(fromfile) as f:
-      self.fromlines = f.readlines()
-    with open(tofile) as f:
-      self.tolines = f.readlines()
+    self._fromlines = None
+    self._tolines = None
+    self._fromdate = None
+    self._todate = None
+
+  @property
+  def fromdate(self):
+    """The modification time of fromfile, formatted on first access."""
+    if self._fromdate is None:
+      self._fromdate = time.ctime(os.stat(self._fromfile).st_mtime)
+    return self._fromdate
+
+  @property
+  def todate(self):
+    """The modification time of tofile, formatted on first access."""
+    if self._todate is None:
+      self._todate = time.ctime(os.stat(self._tofile).st_mtime)
+    return self._todate
+
+  @property
+  def fromlines(self):
+    """The lines of fromfile, read on first access."""
+    if self._fromlines is None:
+      self._fromlines = _read_lines(self._fromfile)
+    return self._fromlines
+
+  @property
+  def tolines(self):
+    """The lines of tofile, read on first access."""
+    if self._tolines is None:
+      self._tolines = _read_lines(self._tofile)
+    return self._tolines
 
   def unified_diff(self, lines=3):
     return difflib.unified_diff(
@@ -88,7 +119,7 @@ class DiffLibWrapper(object):
     return difflib.ndiff(self.fromlines, self.tolines)
 
   def make_file(self, context=False, lines=3):
-    return difflib.HtmlDiff().make_file(
+    return _HTML_DIFF.make_file(
         self.fromlines, self.tolines, self._fromfile, self._tofile,
         context=context, numlines=lines)
 
@@ -97,8 +128,34 @@ class DiffLibWrapper(object):
         self.fromlines, self.tolines, self._fromfile,
         self._tofile, self.fromdate, self.todate, n=lines)
 
+  def unified_diff_str(self, lines=3):
+    """Returns the unified diff as a single string."""
+    return ''.join(self.unified_diff(lines))
+
+  def ndiff_str(self):
+    """Returns the ndiff as a single string."""
+    return ''.join(self.ndiff())
+
+  def context_diff_str(self, lines=3):
+    """Returns the context diff as a single string."""
+    return ''.join(self.context_diff(lines))
+
+
+# Line boundaries recognized by str.splitlines but not by file.readlines.
+_EXTRA_LINE_BREAKS = re.compile(r'[\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+def _read_lines(filename):
+  """Reads filename with one read(), splitting lines as readlines() would."""
+  with open(filename) as f:
+    text = f.read()
+  if _EXTRA_LINE_BREAKS.search(text):
+    return io.StringIO(text).readlines()
+  return text.splitlines(keepends=True)
+
 
 def main():
+  import fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
   fire.Fire(DiffLibWrapper, name='diff')
 
 if __name__ == '__main__':
@@ -28,9 +28,12 @@ class DiffTest(testutils.BaseTestCase):
   It is not the goal of these tests to exhaustively test difflib functionality.
   """
 
-  def setUp(self):
-    self.file1 = file1 = tempfile.NamedTemporaryFile()
-    self.file2 = file2 = tempfile.NamedTemporaryFile()
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # The files are only read, so they are written once for the whole class.
+    cls.file1 = file1 = tempfile.NamedTemporaryFile()  # pylint: disable=consider-using-with
+    cls.file2 = file2 = tempfile.NamedTemporaryFile()  # pylint: disable=consider-using-with
 
     file1.write(b'test\ntest1\n')
     file2.write(b'test\ntest2\nextraline\n')
@@ -38,12 +41,27 @@ class DiffTest(testutils.BaseTestCase):
     file1.flush()
     file2.flush()
 
-    self.diff = diff.DiffLibWrapper(file1.name, file2.name)
+  @classmethod
+  def tearDownClass(cls):
+    cls.file1.close()
+    cls.file2.close()
+    super().tearDownClass()
+
+  def setUp(self):
+    super().setUp()
+    self.diff = diff.DiffLibWrapper(self.file1.name, self.file2.name)
 
   def testSetUp(self):
     self.assertEqual(self.diff.fromlines, ['test\n', 'test1\n'])
     self.assertEqual(self.diff.tolines, ['test\n', 'test2\n', 'extraline\n'])
 
+  def testFormFeedDoesNotSplitLines(self):
+    with tempfile.NamedTemporaryFile() as file3:
+      file3.write(b'page1\fpage2\n')
+      file3.flush()
+      wrapper = diff.DiffLibWrapper(file3.name, self.file2.name)
+      self.assertEqual(wrapper.fromlines, ['page1\fpage2\n'])
+
   def testUnifiedDiff(self):
     results = list(self.diff.unified_diff())
     self.assertTrue(results[0].startswith('--- ' + self.file1.name))
@@ -83,8 +101,15 @@ class DiffTest(testutils.BaseTestCase):
     results = list(self.diff.ndiff())
     self.assertEqual(results, expected_lines)
 
+  def testDiffStrings(self):
+    self.assertEqual(
+        self.diff.unified_diff_str(), ''.join(self.diff.unified_diff()))
+    self.assertEqual(self.diff.ndiff_str(), ''.join(self.diff.ndiff()))
+    self.assertEqual(
+        self.diff.context_diff_str(), ''.join(self.diff.context_diff()))
+
   def testMakeDiff(self):
-    self.assertTrue(''.join(self.diff.make_file()).startswith('\n<!DOC'))
+    self.assertTrue(self.diff.make_file().startswith('\n<!DOC'))
 
   def testDiffFull(self):
     self.assertIsNotNone(difffull)
@@ -41,10 +41,9 @@ For more useful versions of those last four commands using Python Fire, see
 
 import difflib
 
-import fire
-
 
 def main():
+  import fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
   fire.Fire(difflib, name='difffull')
 
 if __name__ == '__main__':
@@ -14,14 +14,13 @@
 
 """A simple command line tool for testing purposes."""
 
-import fire
-
 
 def identity(arg=None):
   return arg, type(arg)
 
 
 def main(_=None):
+  import fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
   fire.Fire(identity, name='identity')
 
 if __name__ == '__main__':
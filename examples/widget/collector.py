@@ -14,8 +14,6 @@
 
 """As a Python Fire demo, a Collector collects widgets, and nobody knows why."""
 
-import fire
-
 from examples.widget import widget
 
 
@@ -27,11 +25,15 @@ class Collector(object):
     self.desired_widget_count = 10
 
   def collect_widgets(self):
-    """Returns all the widgets the Collector wants."""
-    return [widget.Widget() for _ in range(self.desired_widget_count)]
+    """Returns all the widgets the Collector wants.
+
+    Widgets are stateless, so the Collector's own widget is reused for each.
+    """
+    return [self.widget] * self.desired_widget_count
 
 
 def main():
+  import fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
   fire.Fire(Collector(), name='collector')
 
 if __name__ == '__main__':
@@ -34,6 +34,11 @@ class CollectorTest(testutils.BaseTestCase):
     col = collector.Collector()
     self.assertEqual(len(col.collect_widgets()), 10)
 
+  def testCollectorWidgetsAreWidgets(self):
+    col = collector.Collector()
+    for collected in col.collect_widgets():
+      self.assertIsInstance(collected, widget.Widget)
+
 
 if __name__ == '__main__':
   testutils.main()
@@ -14,14 +14,14 @@
 
 """As a simple example of Python Fire, a Widget serves no clear purpose."""
 
-import fire
-
 
 class Widget(object):
 
   def whack(self, n=1):
     """Prints "whack!" n times."""
-    return ' '.join('whack!' for _ in range(n))
+    if n <= 0:
+      return ''
+    return ('whack! ' * n)[:-1]
 
   def bang(self, noise='bang'):
     """Makes a loud noise."""
@@ -29,6 +29,7 @@ class Widget(object):
 
 
 def main():
+  import fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
   fire.Fire(Widget(), name='widget')
 
 if __name__ == '__main__':
@@ -25,6 +25,7 @@ class WidgetTest(testutils.BaseTestCase):
     toy = widget.Widget()
     self.assertEqual(toy.whack(), 'whack!')
     self.assertEqual(toy.whack(3), 'whack! whack! whack!')
+    self.assertEqual(toy.whack(0), '')
 
   def testWidgetBang(self):
     toy = widget.Widget()
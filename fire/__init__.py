@@ -14,7 +14,42 @@
 
 """The Python Fire module."""
 
-from fire.core import Fire
+import importlib
 
-__all__ = ['Fire']
+__all__ = ['Fire']  # pylint: disable=undefined-all-variable
 __version__ = '0.7.0'
+
+_CORE_SUBMODULES = frozenset([
+    'completion',
+    'console',
+    'core',
+    'custom_descriptions',
+    'decorators',
+    'docstrings',
+    'formatting',
+    'formatting_windows',
+    'helptext',
+    'inspectutils',
+    'interact',
+    'parser',
+    'trace',
+    'value_types',
+])
+
+
+def __getattr__(name):  # pylint: disable=invalid-name
+  # Fire is resolved on first access so that importing the package, as
+  # `python -m fire` does before running __main__, stays cheap.
+  if name == 'Fire':
+    from fire.core import Fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
+    globals()['Fire'] = Fire
+    return Fire
+  # Importing fire.core used to import these submodules as a side effect, so
+  # keep e.g. fire.decorators available without an explicit import.
+  message = f'module {__name__!r} has no attribute {name!r}'
+  if name not in _CORE_SUBMODULES:
+    raise AttributeError(message)
+  try:
+    return importlib.import_module(f'{__name__}.{name}')
+  except ImportError:
+    raise AttributeError(message) from None
@@ -19,11 +19,17 @@ This allows using Fire with third-party libraries without modifying their code.
 """
 
 import importlib
+from importlib import machinery
 from importlib import util
 import os
 import sys
 
-import fire
+# Separators that mark an argument as a file path rather than a module name.
+_PATH_SEPARATORS = tuple(sep for sep in (os.path.sep, os.path.altsep) if sep)
+
+# Modules imported from files, keyed by absolute path and file stat, so that
+# repeated imports of an unchanged file reuse the already executed module.
+_imported_files = {}
 
 cli_string = """usage: python -m fire [module] [arg] ..."
 
@@ -53,12 +59,24 @@ def import_from_file_path(path):
       usually extracted from the path itself.
   """
 
-  if not os.path.exists(path):
+  try:
+    stat = os.stat(path)
+  except OSError:
     raise OSError('Given file path does not exist.')
 
+  cache_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+  if cache_key in _imported_files:
+    return _imported_files[cache_key]
+
   module_name = os.path.basename(path)
 
-  spec = util.spec_from_file_location(module_name, path)
+  if path.endswith('.py'):
+    # Passing the loader explicitly skips importlib's probing of every known
+    # loader suffix.
+    loader = machinery.SourceFileLoader(module_name, path)
+    spec = util.spec_from_file_location(module_name, path, loader=loader)
+  else:
+    spec = util.spec_from_file_location(module_name, path)
 
   if spec is None:
     raise OSError('Unable to load module from specified path.')
@@ -66,12 +84,15 @@ def import_from_file_path(path):
   module = util.module_from_spec(spec)  # pylint: disable=no-member
   spec.loader.exec_module(module)  # pytype: disable=attribute-error
 
+  _imported_files[cache_key] = module, module_name
   return module, module_name
 
 
 def import_from_module_name(module_name):
   """Imports a module and returns it and its name."""
-  module = importlib.import_module(module_name)
+  module = sys.modules.get(module_name)
+  if module is None:
+    module = importlib.import_module(module_name)
   return module, module_name
 
 
@@ -93,9 +114,21 @@ def import_module(module_or_filename):
       usually extracted from the path itself.
   """
 
+  is_path = any(sep in module_or_filename for sep in _PATH_SEPARATORS)
+  is_source = module_or_filename.endswith('.py')
+
+  if not is_path and not is_source:
+    # This can only be loaded as a module, so only stat it if that fails.
+    try:
+      return import_from_module_name(module_or_filename)
+    except ImportError:
+      if os.path.exists(module_or_filename):
+        raise ValueError('Fire can only be called on .py files.')
+      raise
+
   if os.path.exists(module_or_filename):
     # importlib.util.spec_from_file_location requires .py
-    if not module_or_filename.endswith('.py'):
+    if not is_source:
       try:  # try as module instead
         return import_from_module_name(module_or_filename)
       except ImportError:
@@ -103,7 +136,8 @@ def import_module(module_or_filename):
 
     return import_from_file_path(module_or_filename)
 
-  if os.path.sep in module_or_filename:  # Use / to detect if it was a filename.
+  # Use / to detect if it was a filename.
+  if is_path:
     raise OSError('Fire was passed a filename which could not be found.')
 
   return import_from_module_name(module_or_filename)  # Assume it's a module.
@@ -116,6 +150,8 @@ def main(args):
     print(cli_string)
     sys.exit(1)
 
+  import fire  # pylint: disable=import-outside-toplevel,g-import-not-at-top
+
   module_or_filename = args[1]
   module, module_name = import_module(module_or_filename)
 
@@ -25,32 +25,7 @@ import inspect
 from fire import inspectutils
 
 
-def Script(name, component, default_options=None, shell='bash'):
-  if shell == 'fish':
-    return _FishScript(name, _Commands(component), default_options)
-  return _BashScript(name, _Commands(component), default_options)
-
-
-def _BashScript(name, commands, default_options=None):
-  """Returns a Bash script registering a completion function for the commands.
-
-  Args:
-    name: The first token in the commands, also the name of the command.
-    commands: A list of all possible commands that tab completion can complete
-        to. Each command is a list or tuple of the string tokens that make up
-        that command.
-    default_options: A dict of options that can be used with any command. Use
-        this if there are flags that can always be appended to a command.
-  Returns:
-    A string which is the Bash script. Source the bash script to enable tab
-    completion in Bash.
-  """
-  default_options = default_options or set()
-  global_options, options_map, subcommands_map = _GetMaps(
-      name, commands, default_options
-  )
-
-  bash_completion_template = """# bash completion support for {name}
+_BASH_COMPLETION_TEMPLATE = """# bash completion support for {name}
 # DO NOT EDIT.
 # This script is autogenerated by fire/completion.py.
 
@@ -127,32 +102,111 @@ is_prev_global()
 complete -F _complete-{identifier} {command}
 """
 
-  check_wrapper = """
+_BASH_CHECK_WRAPPER = """
   case "${{lastcommand}}" in
   {lastcommand_checks}
   esac"""
 
-  lastcommand_check_template = """
+_BASH_LASTCOMMAND_CHECK_TEMPLATE = """
     {command})
       {opts_assignment}
       opts=$(filter_options $opts)
     ;;"""
 
-  opts_assignment_subcommand_template = """
+_BASH_OPTS_ASSIGNMENT_SUBCOMMAND_TEMPLATE = """
       if is_prev_global; then
         opts="${{GLOBAL_OPTIONS}}"
       else
         opts="{options} ${{GLOBAL_OPTIONS}}"
       fi"""
 
-  opts_assignment_main_command_template = """
+_BASH_OPTS_ASSIGNMENT_MAIN_COMMAND_TEMPLATE = """
       opts="{options} ${{GLOBAL_OPTIONS}}" """
 
+_FISH_SOURCE_TEMPLATE = """function __fish_using_command
+    set cmd (commandline -opc)
+    for i in (seq (count $cmd) 1)
+        switch $cmd[$i]
+        case "-*"
+        case "*"
+            if [ $cmd[$i] = $argv[1] ]
+                return 0
+            else
+                return 1
+            end
+        end
+    end
+    return 1
+end
+
+function __option_entered_check
+    set cmd (commandline -opc)
+    for i in (seq (count $cmd))
+        switch $cmd[$i]
+        case "-*"
+            if [ $cmd[$i] = $argv[1] ]
+                return 1
+            end
+        end
+    end
+    return 0
+end
+
+function __is_prev_global
+    set cmd (commandline -opc)
+    set global_options {global_options}
+    set prev (count $cmd)
+
+    for opt in $global_options
+        if [ "--$opt" = $cmd[$prev] ]
+            echo $prev
+            return 0
+        end
+    end
+    return 1
+end
+
+"""
+
+_FISH_SUBCOMMAND_TEMPLATE = (
+    "complete -c {name} -n '__fish_using_command "
+    "{command}' -f -a {subcommand}\n")
+_FISH_FLAG_TEMPLATE = (
+    "complete -c {name} -n "
+    "'__fish_using_command {command};{prev_global_check} and "
+    "__option_entered_check --{option}' -l {option}\n")
+
+
+def Script(name, component, default_options=None, shell='bash'):
+  if shell == 'fish':
+    return _FishScript(name, _Commands(component), default_options)
+  return _BashScript(name, _Commands(component), default_options)
+
+
+def _BashScript(name, commands, default_options=None):
+  """Returns a Bash script registering a completion function for the commands.
+
+  Args:
+    name: The first token in the commands, also the name of the command.
+    commands: A list of all possible commands that tab completion can complete
+        to. Each command is a list or tuple of the string tokens that make up
+        that command.
+    default_options: A dict of options that can be used with any command. Use
+        this if there are flags that can always be appended to a command.
+  Returns:
+    A string which is the Bash script. Source the bash script to enable tab
+    completion in Bash.
+  """
+  default_options = default_options or set()
+  global_options, options_map, subcommands_map = _GetMaps(
+      name, commands, default_options
+  )
+
   def _GetOptsAssignmentTemplate(command):
     if command == name:
-      return opts_assignment_main_command_template
+      return _BASH_OPTS_ASSIGNMENT_MAIN_COMMAND_TEMPLATE
     else:
-      return opts_assignment_subcommand_template
+      return _BASH_OPTS_ASSIGNMENT_SUBCOMMAND_TEMPLATE
 
   lines = []
   commands_set = set()
@@ -166,18 +220,18 @@ complete -F _complete-{identifier} {command}
         ),
     )
     lines.append(
-        lastcommand_check_template.format(
+        _BASH_LASTCOMMAND_CHECK_TEMPLATE.format(
             command=command,
             opts_assignment=opts_assignment)
     )
   lastcommand_checks = '\n'.join(lines)
 
-  checks = check_wrapper.format(
+  checks = _BASH_CHECK_WRAPPER.format(
       lastcommand_checks=lastcommand_checks,
   )
 
   return (
-      bash_completion_template.format(
+      _BASH_COMPLETION_TEMPLATE.format(
           name=name,
           command=name,
           checks=checks,
@@ -207,78 +261,28 @@ def _FishScript(name, commands, default_options=None):
       name, commands, default_options
   )
 
-  fish_source = """function __fish_using_command
-    set cmd (commandline -opc)
-    for i in (seq (count $cmd) 1)
-        switch $cmd[$i]
-        case "-*"
-        case "*"
-            if [ $cmd[$i] = $argv[1] ]
-                return 0
-            else
-                return 1
-            end
-        end
-    end
-    return 1
-end
-
-function __option_entered_check
-    set cmd (commandline -opc)
-    for i in (seq (count $cmd))
-        switch $cmd[$i]
-        case "-*"
-            if [ $cmd[$i] = $argv[1] ]
-                return 1
-            end
-        end
-    end
-    return 0
-end
-
-function __is_prev_global
-    set cmd (commandline -opc)
-    set global_options {global_options}
-    set prev (count $cmd)
-
-    for opt in $global_options
-        if [ "--$opt" = $cmd[$prev] ]
-            echo $prev
-            return 0
-        end
-    end
-    return 1
-end
-
-"""
-
-  subcommand_template = ("complete -c {name} -n '__fish_using_command "
-                         "{command}' -f -a {subcommand}\n")
-  flag_template = ("complete -c {name} -n "
-                   "'__fish_using_command {command};{prev_global_check} and "
-                   "__option_entered_check --{option}' -l {option}\n")
-
+  fish_source = []
   prev_global_check = ' and __is_prev_global;'
   for command in set(subcommands_map.keys()).union(set(options_map.keys())):
     for subcommand in subcommands_map[command]:
-      fish_source += subcommand_template.format(
+      fish_source.append(_FISH_SUBCOMMAND_TEMPLATE.format(
           name=name,
           command=command,
           subcommand=subcommand,
-      )
+      ))
 
     for option in options_map[command].union(global_options):
       check_needed = command != name
-      fish_source += flag_template.format(
+      fish_source.append(_FISH_FLAG_TEMPLATE.format(
           name=name,
           command=command,
           prev_global_check=prev_global_check if check_needed else '',
           option=option.lstrip('--'),
-      )
+      ))
 
-  return fish_source.format(
+  return _FISH_SOURCE_TEMPLATE.format(
       global_options=' '.join(f'"{option}"' for option in global_options)
-  )
+  ) + ''.join(fish_source)
 
 
 def MemberVisible(component, name, member, class_attrs=None, verbose=False):
@@ -14,24 +14,38 @@
 
 """Tests for the completion module."""
 
+import re
+
 from fire import completion
 from fire import test_components as tc
 from fire import testutils
 
+# Shared fixtures; none of the completion functions mutate their inputs.
+_COMMANDS = (
+    ('run',),
+    ('halt',),
+    ('halt', '--now'),
+)
+_COLORS = {
+    'red': 'green',
+    'blue': 'yellow',
+    '_rainbow': True,
+}
+_DEEPDICT = {'level1': {'level2': {'level3': {'level4': {}}}}}
+
 
 class TabCompletionTest(testutils.BaseTestCase):
 
+  def assertTokensInScript(self, tokens, script):
+    """Asserts that each of tokens is a word or flag in the script."""
+    missing = set(tokens) - set(re.findall(r'[\w\-]+', script))
+    self.assertFalse(missing, f'Tokens missing from script: {sorted(missing)}')
+
   def testCompletionBashScript(self):
     # A sanity check test to make sure the bash completion script satisfies
     # some basic assumptions.
-    commands = [
-        ['run'],
-        ['halt'],
-        ['halt', '--now'],
-    ]
-    script = completion._BashScript(name='command', commands=commands)  # pylint: disable=protected-access
-    self.assertIn('command', script)
-    self.assertIn('halt', script)
+    script = completion._BashScript(name='command', commands=_COMMANDS)  # pylint: disable=protected-access
+    self.assertTokensInScript(['command', 'halt'], script)
 
     for last_command in ['command', 'halt']:
       self.assertIn(f'{last_command})', script)
@@ -39,14 +53,8 @@ class TabCompletionTest(testutils.BaseTestCase):
   def testCompletionFishScript(self):
     # A sanity check test to make sure the fish completion script satisfies
     # some basic assumptions.
-    commands = [
-        ['run'],
-        ['halt'],
-        ['halt', '--now'],
-    ]
-    script = completion._FishScript(name='command', commands=commands)  # pylint: disable=protected-access
-    self.assertIn('command', script)
-    self.assertIn('halt', script)
+    script = completion._FishScript(name='command', commands=_COMMANDS)  # pylint: disable=protected-access
+    self.assertTokensInScript(['command', 'halt'], script)
     self.assertIn('-l now', script)
 
   def testFnCompletions(self):
@@ -66,12 +74,7 @@ class TabCompletionTest(testutils.BaseTestCase):
     self.assertNotIn('3', completions)
 
   def testDictCompletions(self):
-    colors = {
-        'red': 'green',
-        'blue': 'yellow',
-        '_rainbow': True,
-    }
-    completions = completion.Completions(colors)
+    completions = completion.Completions(_COLORS)
     self.assertIn('red', completions)
     self.assertIn('blue', completions)
     self.assertNotIn('green', completions)
@@ -81,12 +84,7 @@ class TabCompletionTest(testutils.BaseTestCase):
     self.assertNotIn(True, completions)
 
   def testDictCompletionsVerbose(self):
-    colors = {
-        'red': 'green',
-        'blue': 'yellow',
-        '_rainbow': True,
-    }
-    completions = completion.Completions(colors, verbose=True)
+    completions = completion.Completions(_COLORS, verbose=True)
     self.assertIn('red', completions)
     self.assertIn('blue', completions)
     self.assertNotIn('green', completions)
@@ -96,56 +94,37 @@ class TabCompletionTest(testutils.BaseTestCase):
     self.assertNotIn(True, completions)
 
   def testDeepDictCompletions(self):
-    deepdict = {'level1': {'level2': {'level3': {'level4': {}}}}}
-    completions = completion.Completions(deepdict)
+    completions = completion.Completions(_DEEPDICT)
     self.assertIn('level1', completions)
     self.assertNotIn('level2', completions)
 
   def testDeepDictScript(self):
-    deepdict = {'level1': {'level2': {'level3': {'level4': {}}}}}
-    script = completion.Script('deepdict', deepdict)
-    self.assertIn('level1', script)
-    self.assertIn('level2', script)
-    self.assertIn('level3', script)
+    script = completion.Script('deepdict', _DEEPDICT)
+    self.assertTokensInScript(['level1', 'level2', 'level3'], script)
     self.assertNotIn('level4', script)  # The default depth is 3.
 
   def testFnScript(self):
     script = completion.Script('identity', tc.identity)
-    self.assertIn('--arg1', script)
-    self.assertIn('--arg2', script)
-    self.assertIn('--arg3', script)
-    self.assertIn('--arg4', script)
+    self.assertTokensInScript(['--arg1', '--arg2', '--arg3', '--arg4'], script)
 
   def testClassScript(self):
     script = completion.Script('', tc.MixedDefaults)
-    self.assertIn('ten', script)
-    self.assertIn('sum', script)
-    self.assertIn('identity', script)
-    self.assertIn('--alpha', script)
-    self.assertIn('--beta', script)
+    self.assertTokensInScript(
+        ['ten', 'sum', 'identity', '--alpha', '--beta'], script)
 
   def testDeepDictFishScript(self):
-    deepdict = {'level1': {'level2': {'level3': {'level4': {}}}}}
-    script = completion.Script('deepdict', deepdict, shell='fish')
-    self.assertIn('level1', script)
-    self.assertIn('level2', script)
-    self.assertIn('level3', script)
+    script = completion.Script('deepdict', _DEEPDICT, shell='fish')
+    self.assertTokensInScript(['level1', 'level2', 'level3'], script)
     self.assertNotIn('level4', script)  # The default depth is 3.
 
   def testFnFishScript(self):
     script = completion.Script('identity', tc.identity, shell='fish')
-    self.assertIn('arg1', script)
-    self.assertIn('arg2', script)
-    self.assertIn('arg3', script)
-    self.assertIn('arg4', script)
+    self.assertTokensInScript(['--arg1', '--arg2', '--arg3', '--arg4'], script)
 
   def testClassFishScript(self):
     script = completion.Script('', tc.MixedDefaults, shell='fish')
-    self.assertIn('ten', script)
-    self.assertIn('sum', script)
-    self.assertIn('identity', script)
-    self.assertIn('alpha', script)
-    self.assertIn('beta', script)
+    self.assertTokensInScript(
+        ['ten', 'sum', 'identity', 'alpha', 'beta'], script)
 
   def testNonStringDictCompletions(self):
     completions = completion.Completions({
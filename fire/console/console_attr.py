@@ -91,6 +91,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import collections
+import functools
 import os
 import sys
 import unicodedata
@@ -181,9 +183,7 @@ class ProgressTrackerSymbols(object):
 class ProgressTrackerSymbolsUnicode(ProgressTrackerSymbols):
   """Characters used by progress trackers."""
 
-  @property
-  def spin_marks(self):
-    return ['⠏', '⠛', '⠹', '⠼', '⠶', '⠧']
+  spin_marks = ('⠏', '⠛', '⠹', '⠼', '⠶', '⠧')
 
   success = text.TypedText(['✓'], text_type=text.TextTypes.PT_SUCCESS)
   failed = text.TypedText(['X'], text_type=text.TextTypes.PT_FAILURE)
@@ -195,9 +195,7 @@ class ProgressTrackerSymbolsUnicode(ProgressTrackerSymbols):
 class ProgressTrackerSymbolsAscii(ProgressTrackerSymbols):
   """Characters used by progress trackers."""
 
-  @property
-  def spin_marks(self):
-    return ['|', '/', '-', '\\',]
+  spin_marks = ('|', '/', '-', '\\')
 
   success = 'OK'
   failed = 'X'
@@ -206,6 +204,15 @@ class ProgressTrackerSymbolsAscii(ProgressTrackerSymbols):
   prefix_length = 3
 
 
+# The box/line and progress tracker classes only hold constants, so every
+# ConsoleAttr shares these instances.
+_BOX_LINE_CHARACTERS_UNICODE = BoxLineCharactersUnicode()
+_BOX_LINE_CHARACTERS_ASCII = BoxLineCharactersAscii()
+_BOX_LINE_CHARACTERS_SCREEN_READER = BoxLineCharactersScreenReader()
+_PROGRESS_TRACKER_SYMBOLS_UNICODE = ProgressTrackerSymbolsUnicode()
+_PROGRESS_TRACKER_SYMBOLS_ASCII = ProgressTrackerSymbolsAscii()
+
+
 class ConsoleAttr(object):
   """Console attribute and special drawing characters and functions accessor.
 
@@ -225,13 +232,18 @@ class ConsoleAttr(object):
         win: Windows code page 437.
     _font_bold: The ANSI bold font embellishment code string.
     _font_italic: The ANSI italic font embellishment code string.
-    _get_raw_key: A function that reads one keypress from stdin with no echo.
+    _get_raw_key: A function that reads one keypress from stdin with no echo,
+        looked up on first use.
     _out: The console output file stream.
+    _supports_ansi: True if the console handles ANSI control sequences.
     _term: TERM environment variable value.
-    _term_size: The terminal (x, y) dimensions in characters.
+    _term_size: The terminal (x, y) dimensions in characters, queried on first
+        use.
   """
 
   _CONSOLE_ATTR_STATE = None
+  # ConsoleAttr states keyed by explicitly requested encoding.
+  _CONSOLE_ATTR_STATES_BY_ENCODING = {}
 
   _ANSI_COLOR = {
       'red': '31;1m',
@@ -245,6 +257,11 @@ class ConsoleAttr(object):
   _BULLETS_WINDOWS = ('■', '≡', '∞', 'Φ', '·')  # cp437 compatible unicode
   _BULLETS_ASCII = ('o', '*', '+', '-')
 
+  # The maximum number of strings whose display width is memoized.
+  _DISPLAY_WIDTH_CACHE_SIZE = 1024
+  # Longer strings are rarely measured twice, so their widths aren't memoized.
+  _DISPLAY_WIDTH_CACHE_MAX_LEN = 256
+
   def __init__(self, encoding=None, suppress_output=False):
     """Constructor.
 
@@ -263,9 +280,11 @@ class ConsoleAttr(object):
       encoding = 'cp437'
     self._encoding = encoding or 'ascii'
     self._term = '' if suppress_output else os.getenv('TERM', '').lower()
+    self._supports_ansi = (self._encoding != 'ascii' and
+                           ('screen' in self._term or 'xterm' in self._term))
 
     # ANSI "standard" attributes.
-    if self.SupportsAnsi():
+    if self._supports_ansi:
       # Select Graphic Rendition parameters from
       # http://en.wikipedia.org/wiki/ANSI_escape_code#graphics
       # Italic '3' would be nice here but its not widely supported.
@@ -277,30 +296,48 @@ class ConsoleAttr(object):
       self._font_bold = ''
       self._font_italic = ''
 
+    # Precomputed control sequences for Colorize() and GetFontCode().
+    if self._csi:
+      self._color_codes = {
+          color: self._csi + code for color, code in self._ANSI_COLOR.items()}
+      self._color_reset = self._csi + self._ANSI_COLOR_RESET
+      self._font_codes = {
+          (False, False): self._csi + 'm',
+          (True, False): self._csi + self._font_bold + 'm',
+          (False, True): self._csi + self._font_italic + 'm',
+          (True, True): '{csi}{bold};{italic}m'.format(
+              csi=self._csi, bold=self._font_bold, italic=self._font_italic),
+      }
+    else:
+      self._color_codes = {}
+      self._color_reset = ''
+      self._font_codes = {}
+
     # Encoded character attributes.
     is_screen_reader = False
     if self._encoding == 'utf8' and not is_screen_reader:
-      self._box_line_characters = BoxLineCharactersUnicode()
+      self._box_line_characters = _BOX_LINE_CHARACTERS_UNICODE
       self._bullets = self._BULLETS_UNICODE
-      self._progress_tracker_symbols = ProgressTrackerSymbolsUnicode()
+      self._progress_tracker_symbols = _PROGRESS_TRACKER_SYMBOLS_UNICODE
     elif self._encoding == 'cp437' and not is_screen_reader:
-      self._box_line_characters = BoxLineCharactersUnicode()
+      self._box_line_characters = _BOX_LINE_CHARACTERS_UNICODE
       self._bullets = self._BULLETS_WINDOWS
       # Windows does not support the unicode characters used for the spinner.
-      self._progress_tracker_symbols = ProgressTrackerSymbolsAscii()
+      self._progress_tracker_symbols = _PROGRESS_TRACKER_SYMBOLS_ASCII
     else:
-      self._box_line_characters = BoxLineCharactersAscii()
+      self._box_line_characters = _BOX_LINE_CHARACTERS_ASCII
       if is_screen_reader:
-        self._box_line_characters = BoxLineCharactersScreenReader()
+        self._box_line_characters = _BOX_LINE_CHARACTERS_SCREEN_READER
       self._bullets = self._BULLETS_ASCII
-      self._progress_tracker_symbols = ProgressTrackerSymbolsAscii()
+      self._progress_tracker_symbols = _PROGRESS_TRACKER_SYMBOLS_ASCII
 
-    # OS specific attributes.
-    self._get_raw_key = [console_attr_os.GetRawKeyFunction()]
-    self._term_size = (
-        (0, 0) if suppress_output else console_attr_os.GetTermSize())
+    # OS specific attributes. These probe the terminal, so they are also
+    # determined on first use.
+    self._suppress_output = suppress_output
+    self._get_raw_key = None
+    self._term_size = None
 
-    self._display_width_cache = {}
+    self._display_width_cache = collections.OrderedDict()
 
   def _GetConsoleEncoding(self):
     """Gets the encoding as declared by the stdout stream.
@@ -318,26 +355,33 @@ class ConsoleAttr(object):
       return 'cp437'
     return None
 
-  def Colorize(self, string, color, justify=None):
+  def Colorize(self, string, color, justify=None, bold=False, italic=False):
     """Generates a colorized string, optionally justified.
 
+    Font embellishments are merged into the color's control sequence, so the
+    result has a single opening and a single closing sequence.
+
     Args:
       string: The string to write.
       color: The color name -- must be in _ANSI_COLOR.
       justify: The justification function, no justification if None. For
         example, justify=lambda s: s.center(10)
+      bold: True for bold embellishment.
+      italic: True for italic embellishment.
 
     Returns:
       str, The colorized string that can be printed to the console.
     """
     if justify:
       string = justify(string)
-    if self._csi and color in self._ANSI_COLOR:
-      return '{csi}{color_code}{string}{csi}{reset_code}'.format(
-          csi=self._csi,
-          color_code=self._ANSI_COLOR[color],
-          reset_code=self._ANSI_COLOR_RESET,
-          string=string)
+    color_code = self._color_codes.get(color)
+    if color_code:
+      if bold or italic:
+        # '\x1b[1m' and '\x1b[31;1m' combine into '\x1b[1;31;1m'.
+        font_code = self._font_codes[(bool(bold), bool(italic))]
+        color_code = '{font};{color}'.format(
+            font=font_code[:-1], color=self._ANSI_COLOR[color])
+      return color_code + string + self._color_reset
     # TODO: Add elif self._encoding == 'cp437': code here.
     return string
 
@@ -354,6 +398,9 @@ class ConsoleAttr(object):
       The console output string buf converted to unicode.
     """
     if isinstance(buf, str):
+      if buf.isascii():
+        # ASCII survives the round trip through any console encoding.
+        return buf
       buf = buf.encode(self._encoding)
     return str(buf, self._encoding, 'replace')
 
@@ -435,14 +482,7 @@ class ConsoleAttr(object):
       The font code string for the requested embellishments. Write this string
         to the console output to control the font settings.
     """
-    if not self._csi:
-      return ''
-    codes = []
-    if bold:
-      codes.append(self._font_bold)
-    if italic:
-      codes.append(self._font_italic)
-    return '{csi}{codes}m'.format(csi=self._csi, codes=';'.join(codes))
+    return self._font_codes.get((bool(bold), bool(italic)), '')
 
   def GetRawKey(self):
     """Reads one key press from stdin with no echo.
@@ -451,7 +491,9 @@ class ConsoleAttr(object):
       The key name, None for EOF, <KEY-*> for function keys, otherwise a
       character.
     """
-    return self._get_raw_key[0]()
+    if self._get_raw_key is None:
+      self._get_raw_key = _GetRawKeyFunction()
+    return self._get_raw_key()
 
   def GetTermIdentifier(self):
     """Returns the TERM environment variable for the console.
@@ -467,6 +509,9 @@ class ConsoleAttr(object):
     Returns:
       (x, y): A tuple of the terminal x and y dimensions.
     """
+    if self._term_size is None:
+      self._term_size = (
+          (0, 0) if self._suppress_output else console_attr_os.GetTermSize())
     return self._term_size
 
   def DisplayWidth(self, buf):
@@ -484,8 +529,15 @@ class ConsoleAttr(object):
 
     cached = self._display_width_cache.get(buf, None)
     if cached is not None:
+      self._display_width_cache.move_to_end(buf)
       return cached
 
+    if buf.isascii() and not (self._csi and self._csi in buf):
+      # Every ASCII character other than newline has width 1.
+      max_width = max(len(line) for line in buf.split('\n'))
+      self._CacheDisplayWidth(buf, max_width)
+      return max_width
+
     width = 0
     max_width = 0
     i = 0
@@ -503,9 +555,17 @@ class ConsoleAttr(object):
         i += 1
     max_width = max(width, max_width)
 
-    self._display_width_cache[buf] = max_width
+    self._CacheDisplayWidth(buf, max_width)
     return max_width
 
+  def _CacheDisplayWidth(self, buf, width):
+    """Memoizes the display width of buf, evicting the least recently used."""
+    if len(buf) > self._DISPLAY_WIDTH_CACHE_MAX_LEN:
+      return
+    self._display_width_cache[buf] = width
+    if len(self._display_width_cache) > self._DISPLAY_WIDTH_CACHE_SIZE:
+      self._display_width_cache.popitem(last=False)
+
   def SplitIntoNormalAndControl(self, buf):
     """Returns a list of (normal_string, control_sequence) tuples from buf.
 
@@ -516,7 +576,7 @@ class ConsoleAttr(object):
     Returns:
       A list of (normal_string, control_sequence) tuples.
     """
-    if not self._csi or not buf:
+    if not self._csi or self._csi not in buf:
       return [(buf, '')]
     seq = []
     i = 0
@@ -541,30 +601,33 @@ class ConsoleAttr(object):
     Returns:
       A list of chunks, all but the last with display width == width.
     """
+    if not self._csi or self._csi not in line:
+      # Without control sequences the line splits at fixed offsets.
+      return [line[i:i + width] for i in range(0, len(line), width)] or ['']
     lines = []
     chunk = ''
     w = 0
     keep = False
     for normal, control in self.SplitIntoNormalAndControl(line):
       keep = True
-      while True:
-        n = width - w
-        w += len(normal)
-        if w <= width:
-          break
-        lines.append(chunk + normal[:n])
+      # Walk normal by offset rather than re-slicing off each emitted chunk.
+      start = 0
+      n = width - w
+      while len(normal) - start > n:
+        lines.append(chunk + normal[start:start + n])
         chunk = ''
         keep = False
+        start += n
+        n = width
         w = 0
-        normal = normal[n:]
-      chunk += normal + control
+      w += len(normal) - start
+      chunk += normal[start:] + control
     if chunk or keep:
       lines.append(chunk)
     return lines
 
   def SupportsAnsi(self):
-    return (self._encoding != 'ascii' and
-            ('screen' in self._term or 'xterm' in self._term))
+    return self._supports_ansi
 
 
 class Colorizer(object):
@@ -628,6 +691,12 @@ class Colorizer(object):
         self._con.Colorize(self._string, self._color, justify or self._justify))
 
 
+@functools.lru_cache(maxsize=None)
+def _GetRawKeyFunction():
+  """Returns the OS raw key reader, resolving it once per process."""
+  return console_attr_os.GetRawKeyFunction()
+
+
 def GetConsoleAttr(encoding=None, reset=False):
   """Gets the console attribute state.
 
@@ -649,15 +718,23 @@ def GetConsoleAttr(encoding=None, reset=False):
   Returns:
     The global ConsoleAttr state object.
   """
-  attr = ConsoleAttr._CONSOLE_ATTR_STATE  # pylint: disable=protected-access
-  if not reset:
-    if not attr:
-      reset = True
-    elif encoding and encoding != attr.GetEncoding():
-      reset = True
+  # pylint: disable=protected-access
+  states = ConsoleAttr._CONSOLE_ATTR_STATES_BY_ENCODING
+  attr = ConsoleAttr._CONSOLE_ATTR_STATE
+  if reset:
+    states.clear()
+  elif not attr:
+    reset = True
+  elif encoding and encoding != attr.GetEncoding():
+    # Reuse the state previously created for this encoding, if any.
+    attr = states.get(encoding)
+    reset = attr is None
   if reset:
     attr = ConsoleAttr(encoding=encoding)
-    ConsoleAttr._CONSOLE_ATTR_STATE = attr  # pylint: disable=protected-access
+    if encoding:
+      states[encoding] = attr
+  ConsoleAttr._CONSOLE_ATTR_STATE = attr
+  # pylint: enable=protected-access
   return attr
 
 
@@ -693,9 +770,17 @@ def GetCharacterDisplayWidth(char):
   if not isinstance(char, str):
     # Non-unicode chars have width 1. Don't use this function on control chars.
     return 1
+  return _GetUnicodeCharacterDisplayWidth(char)
+
 
-  # Normalize to avoid special cases.
-  char = unicodedata.normalize('NFC', char)
+@functools.lru_cache(maxsize=4096)
+def _GetUnicodeCharacterDisplayWidth(char):
+  """Returns the display width of the unicode char, memoized per char."""
+  if len(char) != 1:
+    # Normalize to compose a base and combining sequence into one char. A
+    # single code point already has the width of its NFC form, and for a few
+    # (e.g. U+0958) NFC would decompose it into two.
+    char = unicodedata.normalize('NFC', char)
 
   if unicodedata.combining(char) != 0:
     # Modifies the previous character and does not move the cursor.
@@ -738,6 +823,9 @@ def SafeText(data, encoding=None, escape=True):
   """
   if data is None:
     return 'None'
+  if isinstance(data, str) and data.isascii():
+    # ASCII text is safe in any console encoding.
+    return data
   encoding = encoding or GetConsoleAttr().GetEncoding()
   string = encoding_util.Decode(data, encoding=encoding)
 
@@ -776,6 +864,9 @@ def EncodeToBytes(data):
     # Already bytes - our work is done.
     return data
 
+  if isinstance(data, str) and data.isascii():
+    return data.encode('ascii')
+
   # Coerce to text that will be converted to bytes.
   s = str(data)
 
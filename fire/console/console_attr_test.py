@@ -0,0 +1,155 @@
+# Copyright (C) 2018 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the console_attr module."""
+
+import os
+from unittest import mock
+
+from fire import testutils
+from fire.console import console_attr
+
+
+def _AnsiConsoleAttr():
+  with mock.patch.dict(os.environ, {'TERM': 'xterm'}):
+    return console_attr.ConsoleAttr(encoding='utf8')
+
+
+def _PlainConsoleAttr():
+  with mock.patch.dict(os.environ, {'TERM': 'dumb'}):
+    return console_attr.ConsoleAttr(encoding='ascii')
+
+
+class ColorizeTest(testutils.BaseTestCase):
+
+  def testColor(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.Colorize('text', 'red'),
+                     '\x1b[31;1mtext\x1b[39;0m')
+
+  def testBoldIsMergedIntoColorSequence(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.Colorize('text', 'red', bold=True),
+                     '\x1b[1;31;1mtext\x1b[39;0m')
+    self.assertEqual(attr.Colorize('text', 'green', italic=True),
+                     '\x1b[4;32mtext\x1b[39;0m')
+    self.assertEqual(attr.Colorize('text', 'blue', bold=True, italic=True),
+                     '\x1b[1;4;34;1mtext\x1b[39;0m')
+
+  def testJustify(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.Colorize('x', 'green', justify=lambda s: s.center(3)),
+                     '\x1b[32m x \x1b[39;0m')
+
+  def testNoAnsi(self):
+    attr = _PlainConsoleAttr()
+    self.assertEqual(attr.Colorize('text', 'red', bold=True, italic=True),
+                     'text')
+    self.assertEqual(attr.GetFontCode(bold=True), '')
+    self.assertEqual(attr.GetFontCode(italic=True), '')
+    self.assertEqual(attr.GetFontCode(), '')
+
+  def testFontCode(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.GetFontCode(), '\x1b[m')
+    self.assertEqual(attr.GetFontCode(bold=True), '\x1b[1m')
+    self.assertEqual(attr.GetFontCode(italic=True), '\x1b[4m')
+    self.assertEqual(attr.GetFontCode(bold=True, italic=True), '\x1b[1;4m')
+
+
+class GetConsoleAttrTest(testutils.BaseTestCase):
+
+  def setUp(self):
+    super(GetConsoleAttrTest, self).setUp()
+    # Start from, and restore, an empty global state.
+    for name, value in (('_CONSOLE_ATTR_STATE', None),
+                        ('_CONSOLE_ATTR_STATES_BY_ENCODING', {})):
+      patcher = mock.patch.object(console_attr.ConsoleAttr, name, value)
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
+  def testSameEncodingReturnsSameState(self):
+    attr = console_attr.GetConsoleAttr('utf8')
+    self.assertIs(console_attr.GetConsoleAttr(), attr)
+    self.assertIs(console_attr.GetConsoleAttr('utf8'), attr)
+
+  def testSwitchingBackReturnsFirstState(self):
+    utf8 = console_attr.GetConsoleAttr('utf8')
+    ascii_attr = console_attr.GetConsoleAttr('ascii')
+    self.assertIsNot(ascii_attr, utf8)
+    self.assertEqual(ascii_attr.GetEncoding(), 'ascii')
+    self.assertIs(console_attr.GetConsoleAttr('utf8'), utf8)
+    self.assertIs(console_attr.GetConsoleAttr('ascii'), ascii_attr)
+
+  def testResetClearsStates(self):
+    utf8 = console_attr.GetConsoleAttr('utf8')
+    ascii_attr = console_attr.GetConsoleAttr('ascii')
+    reset = console_attr.GetConsoleAttr('utf8', reset=True)
+    self.assertIsNot(reset, utf8)
+    self.assertIsNot(console_attr.GetConsoleAttr('ascii'), ascii_attr)
+    self.assertIs(console_attr.GetConsoleAttr('utf8'), reset)
+
+
+class DisplayWidthTest(testutils.BaseTestCase):
+
+  def testAscii(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.DisplayWidth(''), 0)
+    self.assertEqual(attr.DisplayWidth('abc'), 3)
+    self.assertEqual(attr.DisplayWidth('abc\nabcde\nab'), 5)
+
+  def testWideCharacters(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.DisplayWidth('你好'), 4)
+    self.assertEqual(attr.DisplayWidth('a你\nabc'), 3)
+
+  def testControlSequences(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.DisplayWidth('\x1b[1mabc\x1b[m'), 3)
+    self.assertEqual(attr.DisplayWidth(attr.Colorize('abc', 'red')), 3)
+
+  def testCachedWidthIsStable(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.DisplayWidth('\x1b[1m你\x1b[m'), 2)
+    self.assertEqual(attr.DisplayWidth('\x1b[1m你\x1b[m'), 2)
+
+
+class SplitLineTest(testutils.BaseTestCase):
+
+  def testAscii(self):
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.SplitLine('abcdefg', 3), ['abc', 'def', 'g'])
+    self.assertEqual(attr.SplitLine('abcdef', 3), ['abc', 'def'])
+    self.assertEqual(attr.SplitLine('', 3), [''])
+
+  def testWideCharacters(self):
+    # Lines are split by characters, not by display width.
+    attr = _AnsiConsoleAttr()
+    self.assertEqual(attr.SplitLine('你好吗', 2), ['你好', '吗'])
+
+  def testControlSequences(self):
+    attr = _AnsiConsoleAttr()
+    # Control sequences have no width and stay with the preceding text.
+    self.assertEqual(attr.SplitLine('\x1b[1mabcd\x1b[m', 2),
+                     ['\x1b[1mab', 'cd\x1b[m'])
+    self.assertEqual(attr.SplitLine('ab\x1b[1mcdefg', 3),
+                     ['ab\x1b[1mc', 'def', 'g'])
+
+  def testNoAnsiKeepsEscapeCharacters(self):
+    attr = _PlainConsoleAttr()
+    self.assertEqual(attr.SplitLine('\x1b[1mab', 3), ['\x1b[1', 'mab'])
+
+
+if __name__ == '__main__':
+  testutils.main()
@@ -15,10 +15,12 @@
 
 """General console printing utilities used by the Cloud SDK."""
 
+import codecs
 import os
 import signal
 import subprocess
 import sys
+import weakref
 
 from fire.console import console_attr
 from fire.console import console_pager
@@ -26,6 +28,29 @@ from fire.console import encoding
 from fire.console import files
 
 
+# The number of characters encoded and written to the pager at a time.
+_PAGER_CHUNK_SIZE = 64 * 1024
+
+# Memoized isatty() results, keyed weakly by stream so replaced streams (e.g.
+# in tests) are looked up afresh.
+_isatty_cache = weakref.WeakKeyDictionary()
+
+
+def _IsATty(stream):
+  """Returns stream.isatty(), memoized per stream object."""
+  try:
+    return _isatty_cache[stream]
+  except (KeyError, TypeError):
+    pass
+  isatty = stream.isatty()
+  try:
+    _isatty_cache[stream] = isatty
+  except TypeError:
+    # The stream does not support weak references; don't memoize it.
+    pass
+  return isatty
+
+
 def IsInteractive(output=False, error=False, heuristic=False):
   """Determines if the current terminal session is interactive.
 
@@ -40,11 +65,11 @@ def IsInteractive(output=False, error=False, heuristic=False):
   Returns:
     True if the current terminal session is interactive.
   """
-  if not sys.stdin.isatty():
+  if not _IsATty(sys.stdin):
     return False
-  if output and not sys.stdout.isatty():
+  if output and not _IsATty(sys.stdout):
     return False
-  if error and not sys.stderr.isatty():
+  if error and not _IsATty(sys.stderr):
     return False
 
   if heuristic:
@@ -74,8 +99,24 @@ def More(contents, out, prompt=None, check_pager=True):
     prompt: The page break prompt.
     check_pager: Checks the PAGER env var and uses it if True.
   """
+  MoreLines([contents], out, prompt=prompt, check_pager=check_pager)
+
+
+def MoreLines(lines, out, prompt=None, check_pager=True):
+  """Like More(), but pages an iterable of text strings.
+
+  The strings are written as is, so each should end with its own newline.
+  Unless the internal pager is used they are streamed without being joined
+  into one string first.
+
+  Args:
+    lines: An iterable of the text strings to page.
+    out: The output stream.
+    prompt: The page break prompt.
+    check_pager: Checks the PAGER env var and uses it if True.
+  """
   if not IsInteractive(output=True):
-    out.write(contents)
+    out.writelines(lines)
     return
   if check_pager:
     pager = encoding.GetEncodedValue(os.environ, 'PAGER', None)
@@ -99,12 +140,39 @@ def More(contents, out, prompt=None, check_pager=True):
       signal.signal(signal.SIGINT, signal.SIG_IGN)
       p = subprocess.Popen(pager, stdin=subprocess.PIPE, shell=True)
       enc = console_attr.GetConsoleAttr().GetEncoding()
-      p.communicate(input=contents.encode(enc))
+      _WriteToPager(p, lines, enc)
       p.wait()
       # Start using default signal handling for SIGINT again.
       signal.signal(signal.SIGINT, signal.SIG_DFL)
       if less_orig is None:
         encoding.SetEncodedValue(os.environ, 'LESS', None)
       return
-  # Fall back to the internal pager.
-  console_pager.Pager(contents, out, prompt).Run()
+  # Fall back to the internal pager, which needs all of the contents at once.
+  console_pager.Pager(''.join(lines), out, prompt).Run()
+
+
+def _WriteToPager(p, lines, enc):
+  """Streams lines to the pager process p in encoded chunks.
+
+  Only one chunk of encoded bytes is held in memory at a time, and the pager
+  can start displaying output before all of it has been written.
+
+  Args:
+    p: The pager subprocess.Popen object, with a stdin pipe.
+    lines: An iterable of the text strings to page.
+    enc: The encoding to write lines in.
+  """
+  encoder = codecs.getincrementalencoder(enc)()
+  try:
+    for contents in lines:
+      for i in range(0, len(contents), _PAGER_CHUNK_SIZE):
+        p.stdin.write(encoder.encode(contents[i:i + _PAGER_CHUNK_SIZE]))
+    p.stdin.write(encoder.encode('', final=True))
+  except BrokenPipeError:
+    # The pager exited before reading everything, e.g. the user quit early.
+    pass
+  finally:
+    try:
+      p.stdin.close()
+    except BrokenPipeError:
+      pass
@@ -0,0 +1,99 @@
+# Copyright (C) 2018 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the console_io module."""
+
+import io
+import os
+from unittest import mock
+
+from fire import testutils
+from fire.console import console_attr
+from fire.console import console_io
+
+
+class _FakePager(object):
+  """A subprocess.Popen stand-in whose stdin records the bytes written."""
+
+  def __init__(self, *args, **kwargs):
+    del args, kwargs  # Unused.
+    self.stdin = mock.MagicMock()
+    self.waited = False
+
+  def wait(self):
+    self.waited = True
+
+  def written(self):
+    return b''.join(call[0][0] for call in self.stdin.write.call_args_list)
+
+
+class MoreLinesTest(testutils.BaseTestCase):
+
+  def testNonInteractiveWritesLines(self):
+    out = io.StringIO()
+    lines = iter(['one\n', 'two\n', 'three\n'])
+    with mock.patch.object(console_io, 'IsInteractive', return_value=False):
+      console_io.MoreLines(lines, out)
+    self.assertEqual(out.getvalue(), 'one\ntwo\nthree\n')
+
+  def testNonInteractiveMoreWritesContents(self):
+    out = io.StringIO()
+    with mock.patch.object(console_io, 'IsInteractive', return_value=False):
+      console_io.More('contents\n', out)
+    self.assertEqual(out.getvalue(), 'contents\n')
+
+  def testExternalPagerGetsAllLines(self):
+    pagers = []
+
+    def FakePopen(*args, **kwargs):
+      pagers.append(_FakePager(*args, **kwargs))
+      return pagers[-1]
+
+    lines = ['one\n', 'two\n']
+    with mock.patch.object(console_io, 'IsInteractive', return_value=True), \
+        mock.patch.dict(os.environ, {'PAGER': 'fakepager'}), \
+        mock.patch.object(console_io.subprocess, 'Popen', FakePopen), \
+        mock.patch.object(console_io.signal, 'signal'):
+      console_io.MoreLines(iter(lines), io.StringIO())
+    enc = console_attr.GetConsoleAttr().GetEncoding()
+    self.assertEqual(len(pagers), 1)
+    self.assertEqual(pagers[0].written(), ''.join(lines).encode(enc))
+    self.assertTrue(pagers[0].waited)
+    pagers[0].stdin.close.assert_called_once_with()
+
+
+class WriteToPagerTest(testutils.BaseTestCase):
+
+  def testWritesInChunks(self):
+    pager = _FakePager()
+    lines = ['abcdefghij', 'ü\n', '']
+    with mock.patch.object(console_io, '_PAGER_CHUNK_SIZE', 4):
+      console_io._WriteToPager(pager, lines, 'utf-8')  # pylint: disable=protected-access
+    self.assertEqual(pager.written(), 'abcdefghijü\n'.encode('utf-8'))
+    for call in pager.stdin.write.call_args_list:
+      self.assertLessEqual(len(call[0][0].decode('utf-8')), 4)
+    pager.stdin.close.assert_called_once_with()
+
+  def testBrokenPipeStopsWriting(self):
+    pager = _FakePager()
+    pager.stdin.write.side_effect = BrokenPipeError
+    pager.stdin.close.side_effect = BrokenPipeError
+    with mock.patch.object(console_io, '_PAGER_CHUNK_SIZE', 4):
+      console_io._WriteToPager(pager, ['abcdefghij'], 'utf-8')  # pylint: disable=protected-access
+    pager.stdin.write.assert_called_once_with(b'abcd')
+    pager.stdin.close.assert_called_once_with()
+
+
+if __name__ == '__main__':
+  testutils.main()
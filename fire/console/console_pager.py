@@ -19,12 +19,20 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import bisect
+import functools
 import re
 import sys
 
 from fire.console import console_attr
 
 
+@functools.lru_cache(maxsize=128)
+def _CompileSearchPattern(pattern):
+  """Returns the compiled search RE for pattern, memoized across searches."""
+  return re.compile(pattern)
+
+
 class Pager(object):
   """A simple console text pager.
 
@@ -40,12 +48,22 @@ class Pager(object):
 
   Attributes:
     _attr: The current ConsoleAttr handle.
+    _buf: The output written since the last flush to _out.
     _clear: A string that clears the prompt when written to _out.
     _contents: The entire contents of the text lines to page.
     _height: The terminal height in characters.
     _out: The output stream, log.out (effectively) if None.
     _prompt: The page break prompt.
+    _prompt_prefix: The part of _prompt before {percent}, or None if _prompt
+      must be formatted.
+    _prompt_suffix: The part of _prompt after {percent}.
     _search_direction: The search direction command, n:forward, N:reverse.
+    _search_hits: The sorted indices of the _lines matching the current search
+      pattern, computed on the first n or N after the pattern changes.
+    _search_text: The newline joined _lines and the offsets of each line in
+      it, computed on the first literal search.
+    _search_literal: The current search pattern if it has no RE special
+      characters, otherwise None.
     _search_pattern: The current forward/reverse search compiled RE.
     _width: The termonal width in characters.
   """
@@ -98,7 +116,14 @@ class Pager(object):
     """
     self._contents = contents
     self._out = out or sys.stdout
+    self._buf = []
+    # Buffers s for the next _Flush() to _out. Bound directly to the buffer's
+    # append to save a method call per write; mockable per instance.
+    self._Write = self._buf.append
     self._search_pattern = None
+    self._search_literal = None
+    self._search_hits = None
+    self._search_text = None
     self._search_direction = None
 
     # prev_pos, prev_next values to force reprint
@@ -114,16 +139,53 @@ class Pager(object):
           normal=self._attr.GetFontCode())
     self._clear = '\r{0}\r'.format(' ' * (self._attr.DisplayWidth(prompt) - 6))
     self._prompt = prompt
+    # Split a prompt whose only replacement field is {percent} around it, so
+    # the prompt can be built without parsing a format string per page.
+    if (prompt.count('{') == 1 and prompt.count('}') == 1 and
+        '{percent}' in prompt):
+      self._prompt_prefix, _, self._prompt_suffix = prompt.partition(
+          '{percent}')
+    else:
+      self._prompt_prefix = self._prompt_suffix = None
+
+    # The pager commands, keyed by their key names.
+    self._commands = {}
+    for keys, command in (
+        (('<PAGE-UP>', '<LEFT-ARROW>', 'b', '\x02'), self._PreviousPage),
+        (('<PAGE-DOWN>', '<RIGHT-ARROW>', 'f', '\x06', ' '), self._NextPage),
+        (('<HOME>', 'g'), self._FirstPage),
+        (('<END>', 'G'), self._LastPage),
+        (('<DOWN-ARROW>', 'j', '+', '\n', '\r'), self._NextLine),
+        (('<UP-ARROW>', 'k', '-'), self._PreviousLine),
+        (('n', 'N'), self._NextSearchMatch),
+    ):
+      self._commands.update(dict.fromkeys(keys, command))
 
     # Initialize a list of lines with long lines split into separate display
     # lines.
+    split_line = self._attr.SplitLine
+    width = self._width
+    csi = self._attr.GetControlSequenceIndicator()
     self._lines = []
     for line in contents.splitlines():
-      self._lines += self._attr.SplitLine(line, self._width)
+      # SplitLine splits lines without control sequences at fixed offsets, so
+      # a short one is kept as is.
+      if len(line) <= width and (not csi or csi not in line):
+        self._lines.append(line)
+      else:
+        self._lines.extend(split_line(line, width))
+
+  def _Flush(self):
+    """Writes the buffered output to self._out in one write."""
+    if self._buf:
+      self._out.write(''.join(self._buf))
+      self._buf.clear()
+    self._out.flush()
 
-  def _Write(self, s):
-    """Mockable helper that writes s to self._out."""
-    self._out.write(s)
+  def _GetRawKey(self):
+    """Flushes the buffered output and returns the next key."""
+    self._Flush()
+    return self._attr.GetRawKey()
 
   def _GetSearchCommand(self, c):
     """Consumes a search command and returns the equivalent pager command.
@@ -138,24 +200,154 @@ class Pager(object):
       The pager command char.
     """
     self._Write(c)
-    buf = ''
+    chars = []
     while True:
-      p = self._attr.GetRawKey()
+      p = self._GetRawKey()
       if p in (None, '\n', '\r') or len(p) != 1:
         break
       self._Write(p)
-      buf += p
-    self._Write('\r' + ' ' * len(buf) + '\r')
+      chars.append(p)
+    buf = ''.join(chars)
+    self._Write('\r{0}\r'.format(' ' * len(buf)))
     if buf:
+      self._search_hits = None
       try:
-        self._search_pattern = re.compile(buf)
+        self._search_pattern = _CompileSearchPattern(buf)
       except re.error:
         # Silently ignore pattern errors.
         self._search_pattern = None
+        self._search_literal = None
         return ''
+      # A pattern without special characters can use a plain substring test.
+      self._search_literal = buf if re.escape(buf) == buf else None
     self._search_direction = 'n' if c == '/' else 'N'
     return 'n'
 
+  def _GetSearchHits(self):
+    """Returns the sorted indices of the lines matching the search pattern.
+
+    The lines are only matched once per search pattern, so repeated n or N
+    commands are a binary search of the cached hits.
+    """
+    if self._search_hits is None:
+      if self._search_literal is not None:
+        self._search_hits = self._FindLiteral(self._search_literal)
+      else:
+        # An RE is matched line by line, so that anchors, \s and lookarounds
+        # can't match across line boundaries.
+        search = self._search_pattern.search
+        self._search_hits = [
+            i for i, line in enumerate(self._lines) if search(line)]
+    return self._search_hits
+
+  # The pager command handlers. Each takes the command key, the current page
+  # start and end line positions and the optional command count, and returns
+  # the new page start position, or None to ignore the command.
+
+  def _PreviousPage(self, c, pos, nxt, count):
+    """Back one page."""
+    del c, nxt, count  # Unused.
+    nxt = pos - self._height
+    if nxt < 0:
+      nxt = 0
+    return nxt
+
+  def _NextPage(self, c, pos, nxt, count):
+    """Forward one page."""
+    del c, count  # Unused.
+    if nxt >= len(self._lines):
+      return None
+    nxt = pos + self._height
+    if nxt >= len(self._lines):
+      nxt = pos
+    return nxt
+
+  def _FirstPage(self, c, pos, nxt, count):
+    """Back to the first page, or to line count."""
+    del c, pos, nxt  # Unused.
+    nxt = count - 1
+    if nxt > len(self._lines) - self._height:
+      nxt = len(self._lines) - self._height
+    if nxt < 0:
+      nxt = 0
+    return nxt
+
+  def _LastPage(self, c, pos, nxt, count):
+    """Forward to the last page, or to count lines from the bottom."""
+    del c, pos, nxt  # Unused.
+    nxt = len(self._lines) - count
+    if nxt > len(self._lines) - self._height:
+      nxt = len(self._lines) - self._height
+    if nxt < 0:
+      nxt = 0
+    return nxt
+
+  def _NextLine(self, c, pos, nxt, count):
+    """Forward one line."""
+    del c, count  # Unused.
+    if nxt >= len(self._lines):
+      return None
+    nxt = pos + 1
+    if nxt >= len(self._lines):
+      nxt = pos
+    return nxt
+
+  def _PreviousLine(self, c, pos, nxt, count):
+    """Back one line."""
+    del c, nxt, count  # Unused.
+    nxt = pos - 1
+    if nxt < 0:
+      nxt = 0
+    return nxt
+
+  def _NextSearchMatch(self, c, pos, nxt, count):
+    """Handles n and N, relative to the current search direction."""
+    del nxt, count  # Unused.
+    if not self._search_pattern:
+      return None
+    hits = self._GetSearchHits()
+    nxt = pos
+    if c == self._search_direction:
+      i = bisect.bisect_right(hits, pos)
+      if i < len(hits):
+        nxt = hits[i]
+    else:
+      i = bisect.bisect_left(hits, pos) - 1
+      if i >= 0:
+        nxt = hits[i]
+    return nxt
+
+  def _FindLiteral(self, literal):
+    """Returns the sorted indices of the lines containing literal.
+
+    The lines are scanned as one newline joined text with str.find(), which
+    skips over non-matching lines without returning to Python per line. The
+    literal never contains a newline, so it can't match across lines.
+
+    Args:
+      literal: The non-empty string to search for.
+
+    Returns:
+      The sorted indices of the _lines containing literal.
+    """
+    if self._search_text is None:
+      starts = []
+      offset = 0
+      for line in self._lines:
+        starts.append(offset)
+        offset += len(line) + 1
+      starts.append(offset)
+      self._search_text = '\n'.join(self._lines), starts
+    text, starts = self._search_text
+    hits = []
+    i = text.find(literal)
+    while i >= 0:
+      line = bisect.bisect_right(starts, i) - 1
+      hits.append(line)
+      # Continue with the next line, a line is only a hit once.
+      i = text.find(literal, starts[line + 1])
+    return hits
+
   def _Help(self):
     """Print command help and wait for any character to continue."""
     clear = self._height - (len(self.HELP_TEXT) -
@@ -163,7 +355,7 @@ class Pager(object):
     if clear > 0:
       self._Write('\n' * clear)
     self._Write(self.HELP_TEXT)
-    self._attr.GetRawKey()
+    self._GetRawKey()
     self._Write('\n')
 
   def Run(self):
@@ -171,6 +363,7 @@ class Pager(object):
     # No paging if the contents are small enough.
     if len(self._lines) <= self._height:
       self._Write(self._contents)
+      self._Flush()
       return
 
     # We will not always reset previous values.
@@ -178,33 +371,46 @@ class Pager(object):
     # Save room for the prompt at the bottom of the page.
     self._height -= 1
 
+    # The lines and the page height don't change while paging.
+    lines = self._lines
+    total = len(lines)
+    height = self._height
+    write = self._Write
+    get_raw_key = self._GetRawKey
+    clear = self._clear
+    commands = self._commands
+
     # Loop over all the pages.
     pos = 0
-    while pos < len(self._lines):
+    while pos < total:
       # Write a page of lines.
-      nxt = pos + self._height
-      if nxt > len(self._lines):
-        nxt = len(self._lines)
-        pos = nxt - self._height
+      nxt = pos + height
+      if nxt > total:
+        nxt = total
+        pos = nxt - height
       # Checks if the starting position is in between the current printed lines
       # so we don't need to reprint all the lines.
       if self.prev_pos < pos < self.prev_nxt:
         # we start where the previous page ended.
-        self._Write('\n'.join(self._lines[self.prev_nxt:nxt]) + '\n')
+        write('\n'.join(lines[self.prev_nxt:nxt]) + '\n')
       elif pos != self.prev_pos and nxt != self.prev_nxt:
-        self._Write('\n'.join(self._lines[pos:nxt]) + '\n')
+        write('\n'.join(lines[pos:nxt]) + '\n')
 
       # Handle the prompt response.
-      percent = self._prompt.format(percent=100 * nxt // len(self._lines))
+      percent = 100 * nxt // total
+      if self._prompt_prefix is not None:
+        percent = f'{self._prompt_prefix}{percent}{self._prompt_suffix}'
+      else:
+        percent = self._prompt.format(percent=percent)
       digits = ''
       while True:
         # We want to reset prev values if we just exited out of the while loop
         if reset_prev_values:
           self.prev_pos, self.prev_nxt = pos, nxt
           reset_prev_values = False
-        self._Write(percent)
-        c = self._attr.GetRawKey()
-        self._Write(self._clear)
+        write(percent)
+        c = get_raw_key()
+        write(clear)
 
         # Parse the command.
         if c in (None,    # EOF.
@@ -214,6 +420,7 @@ class Pager(object):
                  '\x1b',  # ESC.
                 ):
           # Quit.
+          self._Flush()
           return
         elif c in ('/', '?'):
           c = self._GetSearchCommand(c)
@@ -230,70 +437,25 @@ class Pager(object):
           count = 0
 
         # Finally commit to command c.
-        if c in ('<PAGE-UP>', '<LEFT-ARROW>', 'b', '\x02'):
-          # Previous page.
-          nxt = pos - self._height
-          if nxt < 0:
-            nxt = 0
-        elif c in ('<PAGE-DOWN>', '<RIGHT-ARROW>', 'f', '\x06', ' '):
-          # Next page.
-          if nxt >= len(self._lines):
-            continue
-          nxt = pos + self._height
-          if nxt >= len(self._lines):
-            nxt = pos
-        elif c in ('<HOME>', 'g'):
-          # First page.
-          nxt = count - 1
-          if nxt > len(self._lines) - self._height:
-            nxt = len(self._lines) - self._height
-          if nxt < 0:
-            nxt = 0
-        elif c in ('<END>', 'G'):
-          # Last page.
-          nxt = len(self._lines) - count
-          if nxt > len(self._lines) - self._height:
-            nxt = len(self._lines) - self._height
-          if nxt < 0:
-            nxt = 0
-        elif c == 'h':
+        if c == 'h':
           self._Help()
           # Special case when we want to reprint the previous display.
           self.prev_pos, self.prev_nxt = self.PREV_POS_NXT_REPRINT
           nxt = pos
           break
-        elif c in ('<DOWN-ARROW>', 'j', '+', '\n', '\r'):
-          # Next line.
-          if nxt >= len(self._lines):
-            continue
-          nxt = pos + 1
-          if nxt >= len(self._lines):
-            nxt = pos
-        elif c in ('<UP-ARROW>', 'k', '-'):
-          # Previous line.
-          nxt = pos - 1
-          if nxt < 0:
-            nxt = 0
-        elif c in ('n', 'N'):
-          # Next pattern match search.
-          if not self._search_pattern:
-            continue
-          nxt = pos
-          i = pos
-          direction = 1 if c == self._search_direction else -1
-          while True:
-            i += direction
-            if i < 0 or i >= len(self._lines):
-              break
-            if self._search_pattern.search(self._lines[i]):
-              nxt = i
-              break
-        else:
+        command = commands.get(c)
+        if command is None:
           # Silently ignore everything else.
           continue
+        command_nxt = command(c, pos, nxt, count)
+        if command_nxt is None:
+          # The command does not apply here, e.g. there are no more lines.
+          continue
+        nxt = command_nxt
         if nxt != pos:
           # We will exit the while loop because position changed so we can reset
           # prev values.
           reset_prev_values = True
           break
       pos = nxt
+    self._Flush()
@@ -0,0 +1,127 @@
+# Copyright (C) 2018 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the console_pager module."""
+
+import io
+import re
+from unittest import mock
+
+from fire import testutils
+from fire.console import console_attr
+from fire.console import console_pager
+
+# 20 lines, paged 4 at a time in a 5 line terminal.
+_LINES = ['line {}'.format(i) for i in range(20)]
+_LINES[2] = 'a cat'
+_LINES[3] = 'a.b'
+_LINES[5] = 'x marks the spot'
+_LINES[7] = 'axb'
+_LINES[9] = 'concatenate'
+_LINES[11] = 'a.b again'
+_LINES[12] = 'has x inside'
+_LINES[16] = 'cat'
+_CONTENTS = '\n'.join(_LINES) + '\n'
+# Clears the '--{percent}--' prompt.
+_CLEAR = '\r       \r'
+
+
+class PagerTest(testutils.BaseTestCase):
+
+  def _Run(self, keys, contents=_CONTENTS):
+    """Pages contents with the scripted keys.
+
+    Args:
+      keys: The keys returned by each GetRawKey() call.
+      contents: The text to page.
+
+    Returns:
+      (out, reads), the pager output and the output written before each key
+      read.
+    """
+    out = io.StringIO()
+    keys = iter(keys)
+    reads = []
+
+    def GetRawKey(unused_self):
+      reads.append(out.getvalue())
+      return next(keys, None)
+
+    with mock.patch.object(console_attr.ConsoleAttr, 'GetRawKey', GetRawKey), \
+        mock.patch.object(console_attr.ConsoleAttr, 'GetTermSize',
+                          return_value=(80, 5)):
+      console_pager.Pager(contents, out, prompt='--{percent}--').Run()
+    return out.getvalue(), reads
+
+  def _Tops(self, keys):
+    """Returns the top line index of the page shown before each command."""
+    out, _ = self._Run(keys)
+    # The prompt shows the percent of lines up to the end of the page.
+    return [int(p) * len(_LINES) // 100 - 4
+            for p in re.findall(r'--(\d+)--', out)]
+
+  def testShortContentsAreNotPaged(self):
+    out, reads = self._Run([], contents='one\ntwo\n')
+    self.assertEqual(out, 'one\ntwo\n')
+    self.assertEqual(reads, [])
+
+  def testFirstPage(self):
+    out, reads = self._Run(['q'])
+    self.assertEqual(out, '\n'.join(_LINES[:4]) + '\n--20--' + _CLEAR)
+    self.assertEqual(len(reads), 1)
+
+  def testOutputIsFlushedBeforeEachKeyRead(self):
+    out, reads = self._Run(list('/ca\nq'))
+    page = '\n'.join(_LINES[:4]) + '\n--20--'
+    self.assertEqual(reads[0], page)
+    self.assertEqual(reads[1], page + _CLEAR + '/')
+    self.assertEqual(reads[2], page + _CLEAR + '/c')
+    self.assertEqual(reads[3], page + _CLEAR + '/ca')
+    # 'ca' first matches line 2, so the next page ends at 30%.
+    self.assertTrue(reads[4].endswith('--30--'))
+    self.assertTrue(out.startswith(reads[4]))
+
+  def testLiteralSearch(self):
+    # 'cat' is on lines 2, 9 and 16.
+    self.assertEqual(self._Tops(list('/cat\nnnnNNNq')),
+                     [0, 2, 9, 16, 16, 9, 2, 2])
+
+  def testReverseSearch(self):
+    # n follows the ? direction and N reverses it.
+    self.assertEqual(self._Tops(list('G?cat\nnNNq')),
+                     [0, 16, 9, 2, 9, 16])
+
+  def testRegexSearch(self):
+    # '.' matches any character, so 'axb' on line 7 is also a hit.
+    self.assertEqual(self._Tops(list('/a.b\nnnq')), [0, 3, 7, 11])
+
+  def testAnchoredSearch(self):
+    # Only line 5 starts with 'x', line 12 has one inside.
+    self.assertEqual(self._Tops(list('/^x\nnNq')), [0, 5, 5, 5])
+
+  def testNewSearchReplacesHits(self):
+    self.assertEqual(self._Tops(list('/cat\n/^x\nnq')), [0, 2, 5, 5])
+
+  def testInvalidPatternIsIgnored(self):
+    self.assertEqual(self._Tops(list('/[\nnq')), [0, 0, 0])
+
+  def testCountedFirstAndLastPage(self):
+    # <number>g goes to line <number>, <number>G to <number> lines from the
+    # bottom, both clamped to a full last page. Each count digit prompts again.
+    self.assertEqual(self._Tops(list('5g3G2g30gg5Gq')),
+                     [0, 0, 4, 4, 16, 16, 1, 1, 1, 16, 0, 0, 15])
+
+
+if __name__ == '__main__':
+  testutils.main()
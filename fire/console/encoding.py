@@ -54,6 +54,10 @@ def Decode(data, encoding=None):
   if data is None:
     return None
 
+  if type(data) is str:  # pylint: disable=unidiomatic-typecheck
+    # Our work is done here.
+    return data
+
   # First we are going to get the data object to be a text string.
   if isinstance(data, str) or isinstance(data, bytes):
     string = data
@@ -65,12 +69,9 @@ def Decode(data, encoding=None):
     # Our work is done here.
     return string
 
-  try:
+  if string.isascii():  # pytype: disable=attribute-error
     # Just return the string if its pure ASCII.
     return string.decode('ascii')  # pytype: disable=attribute-error
-  except UnicodeError:
-    # The string is not ASCII encoded.
-    pass
 
   # Try the suggested encoding if specified.
   if encoding:
@@ -132,12 +133,12 @@ def GetEncodedValue(env, name, default=None):
   Returns:
     The decoded value of the env var name.
   """
-  name = Encode(name)
   value = env.get(name)
   if value is None:
     return default
   # In Python 3, the environment sets and gets accept and return text strings
-  # only, and it handles the encoding itself so this is not necessary.
+  # only, and it handles the encoding itself, so this only matters for env
+  # dicts holding bytes.
   return Decode(value)
 
 
@@ -160,11 +161,12 @@ def SetEncodedValue(env, name, value, encoding=None):
   # process will have a chance at decoding. Leaving the values as unicode
   # strings will cause os module Unicode exceptions. What good is a language
   # unicode model when the module support could care less?
-  name = Encode(name, encoding=encoding)
+  # In Python 3 the os module does the encoding, so Encode() is a no-op.
+  del encoding  # Unused.
   if value is None:
     env.pop(name, None)
     return
-  env[name] = Encode(value, encoding=encoding)
+  env[name] = value
 
 
 def EncodeEnv(env, encoding=None):
@@ -175,15 +177,8 @@ def EncodeEnv(env, encoding=None):
     encoding: str, The encoding to use or None to use the default.
 
   Returns:
-    {bytes: bytes}, The environment to pass to subprocess.
+    {str: str}, A copy of env to pass to subprocess.
   """
-  encoding = encoding or _GetEncoding()
-  return {
-      Encode(k, encoding=encoding): Encode(v, encoding=encoding)
-      for k, v in env.items()
-  }
-
-
-def _GetEncoding():
-  """Gets the default encoding to use."""
-  return sys.getfilesystemencoding() or sys.getdefaultencoding()
+  # Encode() is a no-op in Python 3, where subprocess does the encoding.
+  del encoding  # Unused.
+  return dict(env)
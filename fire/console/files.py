@@ -19,6 +19,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import functools
 import os
 
 from fire.console import encoding as encoding_util
@@ -30,6 +31,21 @@ def _GetSystemPath():
   return encoding_util.GetEncodedValue(os.environ, 'PATH')
 
 
+@functools.lru_cache(maxsize=8)
+def _SplitPath(path):
+  """Returns the unquoted directories in path, memoized per path string.
+
+  A changed PATH is a different string, so it is split afresh.
+
+  Args:
+    path: A list of directories to search separated by 'os.pathsep'.
+
+  Returns:
+    tuple(str), The directories, with Windows quotes stripped.
+  """
+  return tuple(directory.strip('"') for directory in path.split(os.pathsep))
+
+
 def _FindExecutableOnPath(executable, path, pathext):
   """Internal function to a find an executable.
 
@@ -51,19 +67,25 @@ def _FindExecutableOnPath(executable, path, pathext):
                      'because pathext must be an iterable of strings, but got '
                      'a string.'.format(pathext))
 
+  # The extensions don't change the directory part of the path, so each
+  # directory is joined and normalized only once. Repeated directories are
+  # only probed at their first position in path.
+  prefixes = list(dict.fromkeys(
+      os.path.normpath(os.path.join(directory, executable))
+      for directory in _SplitPath(path)))
   # Prioritize preferred extension over earlier in path.
   for ext in pathext:
-    for directory in path.split(os.pathsep):
-      # Windows can have paths quoted.
-      directory = directory.strip('"')
-      full = os.path.normpath(os.path.join(directory, executable) + ext)
+    for prefix in prefixes:
+      full = prefix + ext
       # On Windows os.access(full, os.X_OK) is always True.
       if os.path.isfile(full) and os.access(full, os.X_OK):
         return full
   return None
 
 
+@functools.lru_cache(maxsize=None)
 def _PlatformExecutableExtensions(platform):
+  """Returns the executable file name extensions for platform, memoized."""
   if platform == platforms.OperatingSystem.WINDOWS:
     return ('.exe', '.cmd', '.bat', '.com', '.ps1')
   else:
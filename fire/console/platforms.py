@@ -19,6 +19,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import collections
+import functools
 import os
 import platform
 import subprocess
@@ -50,57 +52,24 @@ class InvalidEnumValue(Error):  # pylint: disable=g-bad-exception-name
 class OperatingSystem(object):
   """An enum representing the operating system you are running on."""
 
-  class _OS(object):
-    """A single operating system."""
+  class _OS(collections.namedtuple('_OS', ('id', 'name', 'file_name'))):
+    """A single operating system.
 
-    # pylint: disable=redefined-builtin
-    def __init__(self, id, name, file_name):
-      self.id = id
-      self.name = name
-      self.file_name = file_name
+    A tuple, so equality, hashing and ordering are by (id, name, file_name).
+    """
+
+    __slots__ = ()
 
     def __str__(self):
       return self.id
 
-    def __eq__(self, other):
-      return (isinstance(other, type(self)) and
-              self.id == other.id and
-              self.name == other.name and
-              self.file_name == other.file_name)
-
-    def __hash__(self):
-      return hash(self.id) + hash(self.name) + hash(self.file_name)
-
-    def __ne__(self, other):
-      return not self == other
-
-    @classmethod
-    def _CmpHelper(cls, x, y):
-      """Just a helper equivalent to the cmp() function in Python 2."""
-      return (x > y) - (x < y)
-
-    def __lt__(self, other):
-      return self._CmpHelper(
-          (self.id, self.name, self.file_name),
-          (other.id, other.name, other.file_name)) < 0
-
-    def __gt__(self, other):
-      return self._CmpHelper(
-          (self.id, self.name, self.file_name),
-          (other.id, other.name, other.file_name)) > 0
-
-    def __le__(self, other):
-      return not self.__gt__(other)
-
-    def __ge__(self, other):
-      return not self.__lt__(other)
-
   WINDOWS = _OS('WINDOWS', 'Windows', 'windows')
   MACOSX = _OS('MACOSX', 'Mac OS X', 'darwin')
   LINUX = _OS('LINUX', 'Linux', 'linux')
   CYGWIN = _OS('CYGWIN', 'Cygwin', 'cygwin')
   MSYS = _OS('MSYS', 'Msys', 'msys')
   _ALL = [WINDOWS, MACOSX, LINUX, CYGWIN, MSYS]
+  _BY_ID = {value.id: value for value in _ALL}
 
   @staticmethod
   def AllValues():
@@ -129,9 +98,9 @@ class OperatingSystem(object):
     """
     if not os_id:
       return None
-    for operating_system in OperatingSystem._ALL:
-      if operating_system.id == os_id:
-        return operating_system
+    operating_system = OperatingSystem._BY_ID.get(os_id)
+    if operating_system is not None:
+      return operating_system
     if error_on_unknown:
       raise InvalidEnumValue(os_id, 'Operating System',
                              [value.id for value in OperatingSystem._ALL])
@@ -141,21 +110,14 @@ class OperatingSystem(object):
   def Current():
     """Determines the current operating system.
 
+    The operating system can't change while running, so it is only determined
+    once.
+
     Returns:
       OperatingSystemTuple, One of the OperatingSystem constants or None if it
       cannot be determined.
     """
-    if os.name == 'nt':
-      return OperatingSystem.WINDOWS
-    elif 'linux' in sys.platform:
-      return OperatingSystem.LINUX
-    elif 'darwin' in sys.platform:
-      return OperatingSystem.MACOSX
-    elif 'cygwin' in sys.platform:
-      return OperatingSystem.CYGWIN
-    elif 'msys' in sys.platform:
-      return OperatingSystem.MSYS
-    return None
+    return _CurrentOperatingSystem()
 
   @staticmethod
   def IsWindows():
@@ -163,59 +125,47 @@ class OperatingSystem(object):
     return OperatingSystem.Current() is OperatingSystem.WINDOWS
 
 
-class Architecture(object):
-  """An enum representing the system architecture you are running on."""
-
-  class _ARCH(object):
-    """A single architecture."""
-
-    # pylint: disable=redefined-builtin
-    def __init__(self, id, name, file_name):
-      self.id = id
-      self.name = name
-      self.file_name = file_name
+# The sys.platform prefixes of the non-Windows operating systems.
+_SYS_PLATFORM_PREFIXES = (
+    ('linux', OperatingSystem.LINUX),
+    ('darwin', OperatingSystem.MACOSX),
+    ('cygwin', OperatingSystem.CYGWIN),
+    ('msys', OperatingSystem.MSYS),
+)
 
-    def __str__(self):
-      return self.id
-
-    def __eq__(self, other):
-      return (isinstance(other, type(self)) and
-              self.id == other.id and
-              self.name == other.name and
-              self.file_name == other.file_name)
 
-    def __hash__(self):
-      return hash(self.id) + hash(self.name) + hash(self.file_name)
+@functools.lru_cache(maxsize=1)
+def _CurrentOperatingSystem():
+  """Returns the current OperatingSystem constant, memoized."""
+  if os.name == 'nt':
+    return OperatingSystem.WINDOWS
+  sys_platform = sys.platform
+  for prefix, operating_system in _SYS_PLATFORM_PREFIXES:
+    if sys_platform.startswith(prefix):
+      return operating_system
+  return None
 
-    def __ne__(self, other):
-      return not self == other
 
-    @classmethod
-    def _CmpHelper(cls, x, y):
-      """Just a helper equivalent to the cmp() function in Python 2."""
-      return (x > y) - (x < y)
+class Architecture(object):
+  """An enum representing the system architecture you are running on."""
 
-    def __lt__(self, other):
-      return self._CmpHelper(
-          (self.id, self.name, self.file_name),
-          (other.id, other.name, other.file_name)) < 0
+  class _ARCH(collections.namedtuple('_ARCH', ('id', 'name', 'file_name'))):
+    """A single architecture.
 
-    def __gt__(self, other):
-      return self._CmpHelper(
-          (self.id, self.name, self.file_name),
-          (other.id, other.name, other.file_name)) > 0
+    A tuple, so equality, hashing and ordering are by (id, name, file_name).
+    """
 
-    def __le__(self, other):
-      return not self.__gt__(other)
+    __slots__ = ()
 
-    def __ge__(self, other):
-      return not self.__lt__(other)
+    def __str__(self):
+      return self.id
 
   x86 = _ARCH('x86', 'x86', 'x86')
   x86_64 = _ARCH('x86_64', 'x86_64', 'x86_64')
   ppc = _ARCH('PPC', 'PPC', 'ppc')
   arm = _ARCH('arm', 'arm', 'arm')
   _ALL = [x86, x86_64, ppc, arm]
+  _BY_ID = {value.id: value for value in _ALL}
 
   # Possible values for `uname -m` and what arch they map to.
   # Examples of possible values: https://en.wikipedia.org/wiki/Uname
@@ -253,9 +203,9 @@ class Architecture(object):
     """
     if not architecture_id:
       return None
-    for arch in Architecture._ALL:
-      if arch.id == architecture_id:
-        return arch
+    arch = Architecture._BY_ID.get(architecture_id)
+    if arch is not None:
+      return arch
     if error_on_unknown:
       raise InvalidEnumValue(architecture_id, 'Architecture',
                              [value.id for value in Architecture._ALL])
@@ -265,11 +215,26 @@ class Architecture(object):
   def Current():
     """Determines the current system architecture.
 
+    The architecture can't change while running, so it is only determined
+    once.
+
     Returns:
       ArchitectureTuple, One of the Architecture constants or None if it cannot
       be determined.
     """
-    return Architecture._MACHINE_TO_ARCHITECTURE.get(platform.machine().lower())
+    return _CurrentArchitecture()
+
+
+@functools.lru_cache(maxsize=1)
+def _CurrentArchitecture():
+  """Returns the current Architecture constant, memoized."""
+  machine_to_architecture = Architecture._MACHINE_TO_ARCHITECTURE  # pylint: disable=protected-access
+  machine = platform.machine()
+  # The machine name is usually lower case already.
+  architecture = machine_to_architecture.get(machine)
+  if architecture is None:
+    architecture = machine_to_architecture.get(machine.lower())
+  return architecture
 
 
 class Platform(object):
@@ -316,29 +281,10 @@ class Platform(object):
     Returns:
       str, The fragment of the User-Agent string.
     """
-    # Below, there are examples of the value of platform.uname() per platform.
-    # platform.release() is uname[2], platform.version() is uname[3].
-    if self.operating_system == OperatingSystem.LINUX:
-      # ('Linux', '<hostname goes here>', '3.2.5-gg1236',
-      # '#1 SMP Tue May 21 02:35:06 PDT 2013', 'x86_64', 'x86_64')
-      return '({name} {version})'.format(
-          name=self.operating_system.name, version=platform.release())
-    elif self.operating_system == OperatingSystem.WINDOWS:
-      # ('Windows', '<hostname goes here>', '7', '6.1.7601', 'AMD64',
-      # 'Intel64 Family 6 Model 45 Stepping 7, GenuineIntel')
-      return '({name} NT {version})'.format(
-          name=self.operating_system.name, version=platform.version())
-    elif self.operating_system == OperatingSystem.MACOSX:
-      # ('Darwin', '<hostname goes here>', '12.4.0',
-      # 'Darwin Kernel Version 12.4.0: Wed May  1 17:57:12 PDT 2013;
-      # root:xnu-2050.24.15~1/RELEASE_X86_64', 'x86_64', 'i386')
-      format_string = '(Macintosh; {name} Mac OS X {version})'
-      arch_string = (self.architecture.name
-                     if self.architecture == Architecture.ppc else 'Intel')
-      return format_string.format(
-          name=arch_string, version=platform.release())
-    else:
+    build_fragment = _USER_AGENT_FRAGMENT_BUILDERS.get(self.operating_system)
+    if build_fragment is None:
       return '()'
+    return build_fragment(self.architecture)
 
   def AsyncPopenArgs(self):
     """Returns the args for spawning an async process using Popen on this OS.
@@ -377,6 +323,59 @@ class Platform(object):
     return args
 
 
+# Below, there are examples of the value of platform.uname() per platform.
+# platform.release() is uname[2], platform.version() is uname[3].
+
+
+@functools.lru_cache(maxsize=1)
+def _PlatformRelease():
+  """Returns platform.release(), memoized."""
+  return platform.release()
+
+
+@functools.lru_cache(maxsize=1)
+def _PlatformVersion():
+  """Returns platform.version(), memoized."""
+  return platform.version()
+
+
+def _LinuxUserAgentFragment(architecture):
+  """Returns the User-Agent fragment for Linux."""
+  # ('Linux', '<hostname goes here>', '3.2.5-gg1236',
+  # '#1 SMP Tue May 21 02:35:06 PDT 2013', 'x86_64', 'x86_64')
+  del architecture  # Unused.
+  return '({name} {version})'.format(
+      name=OperatingSystem.LINUX.name, version=_PlatformRelease())
+
+
+def _WindowsUserAgentFragment(architecture):
+  """Returns the User-Agent fragment for Windows."""
+  # ('Windows', '<hostname goes here>', '7', '6.1.7601', 'AMD64',
+  # 'Intel64 Family 6 Model 45 Stepping 7, GenuineIntel')
+  del architecture  # Unused.
+  return '({name} NT {version})'.format(
+      name=OperatingSystem.WINDOWS.name, version=_PlatformVersion())
+
+
+def _MacUserAgentFragment(architecture):
+  """Returns the User-Agent fragment for Mac OS X."""
+  # ('Darwin', '<hostname goes here>', '12.4.0',
+  # 'Darwin Kernel Version 12.4.0: Wed May  1 17:57:12 PDT 2013;
+  # root:xnu-2050.24.15~1/RELEASE_X86_64', 'x86_64', 'i386')
+  format_string = '(Macintosh; {name} Mac OS X {version})'
+  arch_string = (architecture.name
+                 if architecture == Architecture.ppc else 'Intel')
+  return format_string.format(name=arch_string, version=_PlatformRelease())
+
+
+# Platform.UserAgentFragment() builders keyed by operating system.
+_USER_AGENT_FRAGMENT_BUILDERS = {
+    OperatingSystem.LINUX: _LinuxUserAgentFragment,
+    OperatingSystem.WINDOWS: _WindowsUserAgentFragment,
+    OperatingSystem.MACOSX: _MacUserAgentFragment,
+}
+
+
 class PythonVersion(object):
   """Class to validate the Python version we are using.
 
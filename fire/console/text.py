@@ -24,6 +24,8 @@ import enum
 class TextAttributes(object):
   """Attributes to use to style text with."""
 
+  __slots__ = ('_format_str', '_color', '_attrs')
+
   def __init__(self, format_str=None, color=None, attrs=None):
     """Defines a set of attributes for a piece of text.
 
@@ -53,6 +55,8 @@ class TextAttributes(object):
 class TypedText(object):
   """Text with a semantic type that will be used for styling."""
 
+  __slots__ = ('texts', 'text_type')
+
   def __init__(self, texts, text_type=None):
     """String of text and a corresponding type to use to style that text.
 
@@ -66,17 +70,25 @@ class TypedText(object):
     self.text_type = text_type
 
   def __len__(self):
-    length = 0
-    for text in self.texts:
-      length += len(text)
-    return length
+    return sum(map(len, self.texts))
+
+  def _Texts(self):
+    """Returns the texts to splice in when this is concatenated.
+
+    Untyped TypedText is just a container, so its texts are spliced into the
+    result instead of nesting it. This keeps chains of + flat.
+    """
+    return self.texts if self.text_type is None else [self]
 
   def __add__(self, other):
-    texts = [self, other]
+    if isinstance(other, TypedText):
+      texts = [*self._Texts(), *other._Texts()]
+    else:
+      texts = [*self._Texts(), other]
     return TypedText(texts)
 
   def __radd__(self, other):
-    texts = [other, self]
+    texts = [other, *self._Texts()]
     return TypedText(texts)
 
 
@@ -35,6 +35,17 @@ class FireImportTest(testutils.BaseTestCase):
     self.assertTrue(hasattr(fire, 'Fire'))
     self.assertFalse(hasattr(fire, '_Fire'))
 
+  def testLazyFireIsCoreFire(self):
+    from fire import core  # pylint: disable=import-outside-toplevel,g-import-not-at-top
+    self.assertIs(fire.Fire, core.Fire)
+
+  def testSubmodulesAreAttributes(self):
+    self.assertTrue(hasattr(fire, 'decorators'))
+    self.assertTrue(hasattr(fire.helptext, 'HelpText'))
+    self.assertFalse(hasattr(fire, 'no_such_module'))
+    self.assertFalse(hasattr(fire, 'a.b'))
+    self.assertIsNone(getattr(fire, 'core.missing', None))
+
 
 if __name__ == '__main__':
   testutils.main()
@@ -56,6 +56,12 @@ class MainModuleFileTest(testutils.BaseTestCase):
       __main__.main(
           ['__main__.py', self.file.name, 'Foo', 'double', '--n', '2'])
 
+  def testFileNameImportIsReused(self):
+    # Confirm that importing an unchanged file twice reuses the module.
+    module, _ = __main__.import_module(self.file.name)
+    module_again, _ = __main__.import_module(self.file.name)
+    self.assertIs(module, module_again)
+
   def testFileNameFailure(self):
     # Confirm that an existing file without a .py suffix raises a ValueError.
     with self.assertRaises(ValueError):